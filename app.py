@@ -3,7 +3,7 @@ import os
 import time
 import uuid
 from datetime import datetime
-from functools import wraps
+from functools import lru_cache, wraps
 
 from flask import (
     Flask,
@@ -17,10 +17,6 @@ from flask import (
     session,
     url_for,
 )
-from pillow_heif import register_heif_opener
-from PIL import Image, ExifTags
-
-register_heif_opener()
 from werkzeug.security import check_password_hash, generate_password_hash
 from werkzeug.utils import secure_filename
 
@@ -37,12 +33,39 @@ ALLOWED_EXTENSIONS = IMAGE_EXTENSIONS | VIDEO_EXTENSIONS
 THUMBNAIL_SIZE = (400, 400)
 DISPLAY_SIZE = (1400, 1400)
 
-# Hash passwords from config on startup
+# Hash passwords from config on startup (once in the master under --preload)
 _users = {config.USERNAME: generate_password_hash(config.PASSWORD)}
 if config.USERNAME2 and config.PASSWORD2:
     _users[config.USERNAME2] = generate_password_hash(config.PASSWORD2)
 
 
+def init_storage():
+    """Create the data directories and database schema. Safe to run repeatedly."""
+    os.makedirs(config.PHOTOS_DIR, exist_ok=True)
+    os.makedirs(config.THUMBNAILS_DIR, exist_ok=True)
+    os.makedirs(config.VIDEOS_DIR, exist_ok=True)
+    os.makedirs(config.DISPLAY_DIR, exist_ok=True)
+    db.init_db()
+
+
+# Runs on import so gunicorn sets up storage too, not just `python app.py`
+init_storage()
+
+
+@lru_cache(maxsize=None)
+def _pil_image():
+    """Import Pillow and register the HEIF opener on first use.
+
+    Keeps the image stack out of worker boot; it's only loaded by the first
+    upload a worker handles.
+    """
+    from pillow_heif import register_heif_opener
+    from PIL import Image
+
+    register_heif_opener()
+    return Image
+
+
 def allowed_file(filename):
     return "." in filename and filename.rsplit(".", 1)[1].lower() in ALLOWED_EXTENSIONS
 
@@ -62,7 +85,7 @@ def extract_exif_date(image):
 
 def process_image(filepath):
     """Open image once, extract EXIF, generate display + thumbnail."""
-    with Image.open(filepath) as img:
+    with _pil_image().open(filepath) as img:
         taken_at = extract_exif_date(img)
 
         if img.mode in ("RGBA", "P"):
@@ -409,9 +432,4 @@ def serve_video(filename):
 # --- Startup ---
 
 if __name__ == "__main__":
-    os.makedirs(config.PHOTOS_DIR, exist_ok=True)
-    os.makedirs(config.THUMBNAILS_DIR, exist_ok=True)
-    os.makedirs(config.VIDEOS_DIR, exist_ok=True)
-    os.makedirs(config.DISPLAY_DIR, exist_ok=True)
-    db.init_db()
     app.run(host="0.0.0.0", port=config.PORT, debug=True)
@@ -0,0 +1,134 @@
+"""Startup benchmark: boot time and per-worker memory under gunicorn.
+
+Exports two git refs into temp dirs and, for each, starts gunicorn with and
+without --preload, then reports how long until the app answers and how much
+memory each worker uses. Linux only (reads /proc).
+
+    venv/bin/python bench_startup.py BEFORE_REF [AFTER_REF]
+
+AFTER_REF defaults to HEAD. Each export gets its own empty data/ directory,
+so the real database and photos are never touched.
+"""
+import argparse
+import os
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.error
+import urllib.request
+
+WORKERS = 4
+REPO_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def export_ref(ref, dest):
+    archive = subprocess.run(["git", "archive", ref], cwd=REPO_DIR, check=True, capture_output=True).stdout
+    subprocess.run(["tar", "-x", "-C", dest], input=archive, check=True)
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def child_pids(pid):
+    pids = []
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat") as f:
+                # ppid is the 2nd field after the parenthesised command name
+                ppid = int(f.read().rsplit(")", 1)[1].split()[1])
+        except (OSError, IndexError, ValueError):
+            continue
+        if ppid == pid:
+            pids.append(int(entry))
+    return pids
+
+
+def memory_kb(pid):
+    """Return (rss, pss) in kB. PSS splits shared pages between the processes sharing them."""
+    rss = pss = 0
+    with open(f"/proc/{pid}/status") as f:
+        for line in f:
+            if line.startswith("VmRSS:"):
+                rss = int(line.split()[1])
+    try:
+        with open(f"/proc/{pid}/smaps_rollup") as f:
+            for line in f:
+                if line.startswith("Pss:"):
+                    pss = int(line.split()[1])
+    except OSError:
+        pass
+    return rss, pss
+
+
+def import_time(app_dir):
+    """Seconds for a fresh interpreter to import the app, i.e. one worker's boot without --preload."""
+    t0 = time.time()
+    subprocess.run([sys.executable, "-c", "import app"], cwd=app_dir, check=True)
+    return time.time() - t0
+
+
+def run_gunicorn(app_dir, preload):
+    port = free_port()
+    cmd = [sys.executable, "-m", "gunicorn", "app:app", "--bind", f"127.0.0.1:{port}",
+           "--workers", str(WORKERS), "--threads", "2", "--timeout", "120"]
+    if preload:
+        cmd.append("--preload")
+
+    t0 = time.time()
+    proc = subprocess.Popen(cmd, cwd=app_dir, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        while True:
+            if proc.poll() is not None:
+                raise RuntimeError(f"gunicorn exited with code {proc.returncode}")
+            try:
+                urllib.request.urlopen(f"http://127.0.0.1:{port}/login", timeout=1)
+                break
+            except (urllib.error.URLError, ConnectionError):
+                time.sleep(0.02)
+        boot = time.time() - t0
+
+        # Let the remaining workers finish loading before sampling memory
+        time.sleep(2)
+        workers = [memory_kb(pid) for pid in child_pids(proc.pid)]
+        return boot, workers
+    finally:
+        proc.terminate()
+        proc.wait()
+
+
+def report(label, app_dir):
+    print(f"{label}")
+    print(f"  import app:          {import_time(app_dir):.2f}s")
+    for preload in (False, True):
+        boot, workers = run_gunicorn(app_dir, preload)
+        rss = sum(r for r, _ in workers) / len(workers) / 1024
+        pss = sum(p for _, p in workers) / len(workers) / 1024
+        name = "--preload" if preload else "no preload"
+        print(f"  {name:<12} boot {boot:.2f}s   per worker: RSS {rss:.1f} MB, PSS {pss:.1f} MB  ({len(workers)} workers)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("before", help="git ref to compare against")
+    parser.add_argument("after", nargs="?", default="HEAD")
+    args = parser.parse_args()
+
+    for label, ref in (("before", args.before), ("after", args.after)):
+        app_dir = tempfile.mkdtemp(prefix="photobook-bench-")
+        try:
+            export_ref(ref, app_dir)
+            report(f"{label} ({ref})", app_dir)
+        finally:
+            shutil.rmtree(app_dir)
+
+
+if __name__ == "__main__":
+    main()
@@ -36,7 +36,12 @@ def init_db():
     # Migrate: add hidden column if missing
     cols = [r[1] for r in conn.execute("PRAGMA table_info(photos)").fetchall()]
     if "hidden" not in cols:
-        conn.execute("ALTER TABLE photos ADD COLUMN hidden INTEGER NOT NULL DEFAULT 0")
+        try:
+            conn.execute("ALTER TABLE photos ADD COLUMN hidden INTEGER NOT NULL DEFAULT 0")
+        except sqlite3.OperationalError as e:
+            # Another gunicorn worker ran the migration first
+            if "duplicate column" not in str(e):
+                raise
     conn.commit()
     conn.close()
 
@@ -4,7 +4,7 @@ cd "$(dirname "$0")"
 
 # Start the Flask app with gunicorn
 source venv/bin/activate
-gunicorn app:app --bind 0.0.0.0:8081 --workers 4 --threads 2 --timeout 120 &
+gunicorn app:app --preload --bind 0.0.0.0:8081 --workers 4 --threads 2 --timeout 120 &
 APP_PID=$!
 
 # Start Cloudflare tunnel